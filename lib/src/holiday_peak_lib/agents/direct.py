@@ -61,17 +61,17 @@ def _default_chat_client_factory(config: FoundryAgentConfig) -> Any:
     that returns an object satisfying MAF's ``SupportsChatGetResponse``
     protocol (e.g., ``OpenAIChatClient``, ``AzureOpenAIChatClient``).
     """
+    if not config.deployment_name:
+        raise ValueError(
+            "DirectModelInvoker requires deployment_name on FoundryAgentConfig "
+            "(env: MODEL_DEPLOYMENT_NAME_FAST / MODEL_DEPLOYMENT_NAME_RICH)."
+        )
     # Imported lazily so test environments without ``agent_framework_foundry``
     # installed can still exercise the rest of the invoker via mocks.
     from agent_framework_foundry import (  # pylint: disable=import-outside-toplevel
         FoundryChatClient,
     )
 
-    if not config.deployment_name:
-        raise ValueError(
-            "DirectModelInvoker requires deployment_name on FoundryAgentConfig "
-            "(env: MODEL_DEPLOYMENT_NAME_FAST / MODEL_DEPLOYMENT_NAME_RICH)."
-        )
     credential = config.credential or DefaultAzureCredential()
     return FoundryChatClient(
         project_endpoint=config.endpoint,
@@ -1,8 +1,21 @@
 """Pytest configuration and shared fixtures."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+import pytest_asyncio
+from holiday_peak_lib.utils.logging import configure_logging
+
+_LIB_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Run lib async tests on one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item) and _LIB_TESTS_DIR in item.path.parents:
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(autouse=True)
@@ -14,8 +27,39 @@ def normalize_foundry_env_for_lib_tests(monkeypatch: pytest.MonkeyPatch) -> None
 
 
 @pytest.fixture
-def mock_redis_client():
-    """Mock Redis client for testing."""
+def base_memory_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Baseline MemorySettings environment; tests override single keys on top."""
+    env = {
+        "REDIS_URL": "redis://localhost:6379",
+        "COSMOS_ACCOUNT_URI": "https://test.documents.azure.com",
+        "COSMOS_DATABASE": "test_db",
+        "COSMOS_CONTAINER": "test_container",
+        "BLOB_ACCOUNT_URL": "https://test.blob.core.windows.net",
+        "BLOB_CONTAINER": "test_blob_container",
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    return env
+
+
+@pytest.fixture
+def base_service_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Baseline ServiceSettings environment; tests override single keys on top."""
+    env = {
+        "SERVICE_NAME": "test-service",
+        "AI_SEARCH_ENDPOINT": "https://search.azure.com",
+        "AI_SEARCH_INDEX": "test-index",
+        "AI_SEARCH_KEY": "test-key-123",
+        "EVENT_HUB_NAMESPACE": "test-namespace",
+        "EVENT_HUB_NAME": "test-hub",
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    return env
+
+
+@pytest.fixture(scope="session")
+def _redis_client_tree():
     client = AsyncMock()
     client.set = AsyncMock(return_value=True)
     client.get = AsyncMock(return_value="test_value")
@@ -24,9 +68,8 @@ def mock_redis_client():
     return client
 
 
-@pytest.fixture
-def mock_cosmos_client():
-    """Mock Cosmos DB client for testing."""
+@pytest.fixture(scope="session")
+def _cosmos_client_tree():
     client = AsyncMock()
     database = AsyncMock()
     container = AsyncMock()
@@ -38,9 +81,8 @@ def mock_cosmos_client():
     return client
 
 
-@pytest.fixture
-def mock_blob_client():
-    """Mock Blob Storage client for testing."""
+@pytest.fixture(scope="session")
+def _blob_client_tree():
     client = AsyncMock()
     container = AsyncMock()
     container.upload_blob = AsyncMock(return_value=None)
@@ -51,6 +93,44 @@ def mock_blob_client():
     return client
 
 
+# The client mock trees are built once per session and only have their call
+# records reset per test. Configured return values and side effects survive
+# the reset, so tests that need different ones must override them with
+# ``monkeypatch.setattr`` to have them restored at teardown.
+
+
+@pytest.fixture
+def mock_redis_client(_redis_client_tree):
+    """Mock Redis client for testing."""
+    _redis_client_tree.reset_mock()
+    return _redis_client_tree
+
+
+@pytest.fixture
+def mock_cosmos_client(_cosmos_client_tree):
+    """Mock Cosmos DB client for testing."""
+    _cosmos_client_tree.reset_mock()
+    return _cosmos_client_tree
+
+
+@pytest.fixture
+def mock_blob_client(_blob_client_tree):
+    """Mock Blob Storage client for testing."""
+    _blob_client_tree.reset_mock()
+    return _blob_client_tree
+
+
+@pytest.fixture(scope="session")
+def base_logger():
+    """Logger configured once per session for the logging helper tests."""
+    # Session fixtures build before function-scoped env cleanup, so clear any
+    # App Insights connection string here to keep the real exporter off.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("APPLICATIONINSIGHTS_CONNECTION_STRING", raising=False)
+        mp.delenv("APPINSIGHTS_CONNECTION_STRING", raising=False)
+        return configure_logging(app_name="test")
+
+
 @pytest.fixture
 def sample_request():
     """Sample request payload for testing."""
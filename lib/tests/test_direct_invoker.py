@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -32,18 +33,37 @@ def _make_config(*, deployment: str | None = "gpt-5-fast") -> FoundryAgentConfig
 def _make_run_response(text: str = "ok", *, usage: dict | None = None) -> Any:
     """Build a fake AgentRunResponse-like object with the attributes the
     invoker reads."""
-    response = MagicMock()
-    response.text = text
-    response.messages = []
-    response.session = None
-    response.response_id = None
-    if usage is not None:
-        usage_obj = MagicMock()
-        usage_obj.to_dict.return_value = usage
-        response.usage_details = usage_obj
-    else:
-        response.usage_details = None
-    return response
+    usage_details = SimpleNamespace(to_dict=lambda: usage) if usage is not None else None
+    return SimpleNamespace(
+        text=text,
+        messages=[],
+        session=None,
+        response_id=None,
+        usage_details=usage_details,
+    )
+
+
+def _make_invoker(
+    agent: Any | None = None,
+    *,
+    config: FoundryAgentConfig | None = None,
+    instructions: str = "x",
+    **kwargs: Any,
+) -> DirectModelInvoker:
+    """Build a DirectModelInvoker wired to a stub chat client.
+
+    When ``agent`` is given it is bound directly so ``_ensure_agent`` is
+    bypassed.
+    """
+    invoker = DirectModelInvoker(
+        config or _make_config(),
+        instructions=instructions,
+        chat_client_factory=lambda _cfg: MagicMock(),
+        **kwargs,
+    )
+    if agent is not None:
+        invoker._agent = agent
+    return invoker
 
 
 class _StubAgent:
@@ -59,13 +79,6 @@ class _StubAgent:
         return self._response
 
 
-class _StreamUpdate:
-    """Stub for ``AgentResponseUpdate`` used in streaming tests."""
-
-    def __init__(self, text: str) -> None:
-        self.text = text
-
-
 class _StreamingStubAgent:
     """Stub agent whose run() returns an async iterable of cumulative updates."""
 
@@ -83,7 +96,8 @@ class _StreamingStubAgent:
 
         async def _gen():
             for text in self._cumulative:
-                yield _StreamUpdate(text)
+                # Plain attribute holder standing in for ``AgentResponseUpdate``.
+                yield SimpleNamespace(text=text)
 
         return _gen()
 
@@ -99,12 +113,7 @@ class TestDirectModelInvokerNonStreaming:
     @pytest.mark.asyncio
     async def test_returns_response_dict_with_telemetry(self):
         stub_agent = _StubAgent(_make_run_response("hello world"))
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="You are a test agent.",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent  # bypass _ensure_agent
+        invoker = _make_invoker(stub_agent, instructions="You are a test agent.")
 
         result = await invoker(messages=[{"role": "user", "content": "hi"}])
 
@@ -120,12 +129,7 @@ class TestDirectModelInvokerNonStreaming:
     async def test_normalizes_dict_message_content_to_json(self):
         """Dict/list message content is JSON-serialized before reaching MAF."""
         stub_agent = _StubAgent(_make_run_response("ok"))
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         await invoker(messages=[{"role": "user", "content": {"sku": "ABC123"}}])
 
@@ -140,12 +144,7 @@ class TestDirectModelInvokerNonStreaming:
     async def test_callable_tools_forwarded_to_agent_run(self):
         """List of callables is forwarded as ``tools=`` on agent.run()."""
         stub_agent = _StubAgent()
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         async def my_tool(**_: Any) -> dict:
             return {"ok": True}
@@ -158,12 +157,7 @@ class TestDirectModelInvokerNonStreaming:
     async def test_dict_callable_tools_forwarded_as_list(self):
         """Dict-of-callables is converted to a list before reaching MAF."""
         stub_agent = _StubAgent()
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         async def tool_a(**_: Any) -> dict:
             return {}
@@ -182,12 +176,7 @@ class TestDirectModelInvokerNonStreaming:
     @pytest.mark.asyncio
     async def test_dict_schema_tools_rejected(self):
         """Dict-schema tool definitions raise TypeError (no JSON-prompt fallback)."""
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = _StubAgent()
+        invoker = _make_invoker(_StubAgent())
 
         with pytest.raises(TypeError, match="callable tools"):
             await invoker(
@@ -207,12 +196,7 @@ class TestDirectModelInvokerNonStreaming:
         response.session = session_obj
 
         stub_agent = _StubAgent(response)
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         result = await invoker(
             messages=[{"role": "user", "content": "hi"}],
@@ -231,12 +215,7 @@ class TestDirectModelInvokerNonStreaming:
         stub_agent = _StubAgent()
         config = _make_config()
         config.max_output_tokens = 800
-        invoker = DirectModelInvoker(
-            config,
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent, config=config)
 
         await invoker(messages=[{"role": "user", "content": "hi"}])
 
@@ -257,13 +236,7 @@ class TestDirectModelInvokerNonStreaming:
 
         slow_agent.run = _slow_run
 
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-            timeout=0.05,
-        )
-        invoker._agent = slow_agent
+        invoker = _make_invoker(slow_agent, timeout=0.05)
 
         result = await invoker(messages=[{"role": "user", "content": "hi"}])
 
@@ -276,12 +249,7 @@ class TestDirectModelInvokerNonStreaming:
     async def test_transport_only_kwargs_discarded(self):
         """``model``, ``temperature``, ``top_p`` etc. are stripped before agent.run()."""
         stub_agent = _StubAgent()
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         await invoker(
             messages=[{"role": "user", "content": "hi"}],
@@ -308,12 +276,7 @@ class TestDirectModelInvokerStreaming:
     async def test_streaming_yields_token_deltas(self):
         """Cumulative MAF updates are yielded as incremental deltas."""
         stub_agent = _StreamingStubAgent(["He", "llo", " world"])
-        invoker = DirectModelInvoker(
-            _make_config(),
-            instructions="x",
-            chat_client_factory=lambda _cfg: MagicMock(),
-        )
-        invoker._agent = stub_agent
+        invoker = _make_invoker(stub_agent)
 
         gen = await invoker(messages=[{"role": "user", "content": "hi"}], stream=True)
 
@@ -1,7 +1,7 @@
 """Tests for memory modules."""
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 from holiday_peak_lib.agents.memory.cold import ColdMemory
@@ -11,6 +11,32 @@ from redis.exceptions import AuthenticationError as RedisAuthenticationError
 from redis.exceptions import ConnectionError as RedisConnectionError
 
 
+def _resolved(value):
+    """Return an already-completed future so awaiting it skips a coroutine frame."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+def _hot_memory() -> HotMemory:
+    return HotMemory("redis://localhost:6379")
+
+
+def _warm_memory() -> WarmMemory:
+    return WarmMemory(
+        account_uri="https://test.documents.azure.com",
+        database="test_db",
+        container="test_container",
+    )
+
+
+def _cold_memory() -> ColdMemory:
+    return ColdMemory(
+        account_url="https://test.blob.core.windows.net",
+        container_name="test_container",
+    )
+
+
 class TestHotMemory:
     """Test HotMemory (Redis) functionality."""
 
@@ -34,96 +60,73 @@ class TestHotMemory:
         assert memory.socket_timeout == 5.0
         assert memory.retry_on_timeout is True
 
-    @pytest.mark.asyncio
-    async def test_connect(self, mock_redis_client, monkeypatch):
+    async def test_connect(self, mock_redis_client):
         """Test connecting to Redis."""
         memory = HotMemory("redis://localhost:6379")
 
-        with patch("redis.asyncio.ConnectionPool.from_url") as mock_pool:
-            with patch("redis.asyncio.Redis") as mock_redis:
-                mock_redis.return_value = mock_redis_client
-                await memory.connect()
-                assert memory.client is not None
+        with patch.multiple("redis.asyncio", ConnectionPool=DEFAULT, Redis=DEFAULT) as mocks:
+            mocks["Redis"].return_value = mock_redis_client
+            await memory.connect()
+            assert memory.client is not None
 
-    @pytest.mark.asyncio
-    async def test_set_value(self, mock_redis_client, monkeypatch):
+    async def test_set_value(self, mock_redis_client):
         """Test setting a value in Redis."""
         memory = HotMemory("redis://localhost:6379")
-        monkeypatch.setattr(memory, "client", mock_redis_client)
+        memory.client = mock_redis_client
 
         await memory.set("test_key", "test_value", ttl_seconds=300)
         mock_redis_client.set.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_set_connects_if_needed(self, mock_redis_client):
-        """Test set auto-connects if not connected."""
-        memory = HotMemory("redis://localhost:6379")
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_redis_client
-            await memory.set("key", "value")
-            # Should check connection status
-
-    @pytest.mark.asyncio
     async def test_get_value(self, mock_redis_client, monkeypatch):
         """Test getting a value from Redis."""
         memory = HotMemory("redis://localhost:6379")
-        monkeypatch.setattr(memory, "client", mock_redis_client)
-        mock_redis_client.get.return_value = "retrieved_value"
+        memory.client = mock_redis_client
+        monkeypatch.setattr(mock_redis_client.get, "return_value", "retrieved_value")
 
         result = await memory.get("test_key")
         assert result == "retrieved_value"
         mock_redis_client.get.assert_called_once_with("test_key")
 
-    @pytest.mark.asyncio
-    async def test_get_connects_if_needed(self, mock_redis_client):
-        """Test get auto-connects if not connected."""
-        memory = HotMemory("redis://localhost:6379")
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_redis_client
-            await memory.get("key")
-
-    @pytest.mark.asyncio
     async def test_get_returns_none_when_redis_auth_fails(self, mock_redis_client, monkeypatch):
         """Redis auth failures should degrade to a cache miss."""
         memory = HotMemory("redis://localhost:6379")
-        monkeypatch.setattr(memory, "client", mock_redis_client)
-        mock_redis_client.get.side_effect = RedisAuthenticationError("invalid password")
+        memory.client = mock_redis_client
+        monkeypatch.setattr(
+            mock_redis_client.get, "side_effect", RedisAuthenticationError("invalid password")
+        )
 
         result = await memory.get("test_key")
 
         assert result is None
         assert memory.client is None
 
-    @pytest.mark.asyncio
     async def test_set_does_not_raise_when_redis_connection_fails(
         self, mock_redis_client, monkeypatch
     ):
         """Redis connectivity failures should make set a no-op."""
         memory = HotMemory("redis://localhost:6379")
-        monkeypatch.setattr(memory, "client", mock_redis_client)
-        mock_redis_client.set.side_effect = RedisConnectionError("unavailable")
+        memory.client = mock_redis_client
+        monkeypatch.setattr(
+            mock_redis_client.set, "side_effect", RedisConnectionError("unavailable")
+        )
 
         await memory.set("test_key", "value", ttl_seconds=60)
 
         assert memory.client is None
 
-    @pytest.mark.asyncio
     async def test_connect_is_single_init_under_concurrency(self, mock_redis_client):
         """Concurrent first-use connect should initialize once."""
         memory = HotMemory("redis://localhost:6379")
 
-        with patch("holiday_peak_lib.agents.memory.hot.redis.ConnectionPool.from_url") as mock_pool:
-            with patch("holiday_peak_lib.agents.memory.hot.redis.Redis") as mock_redis:
-                mock_pool.return_value = object()
-                mock_redis.return_value = mock_redis_client
-                await asyncio.gather(memory.connect(), memory.connect())
+        with patch.multiple(
+            "holiday_peak_lib.agents.memory.hot.redis", ConnectionPool=DEFAULT, Redis=DEFAULT
+        ) as mocks:
+            mocks["ConnectionPool"].from_url.return_value = object()
+            mocks["Redis"].return_value = mock_redis_client
+            await asyncio.gather(memory.connect(), memory.connect())
 
         assert memory.client is mock_redis_client
-        assert mock_redis.call_count == 1
+        assert mocks["Redis"].call_count == 1
 
 
 class TestWarmMemory:
@@ -153,7 +156,6 @@ class TestWarmMemory:
         assert memory.connection_limit == 100
         assert memory.client_kwargs == {"timeout": 10}
 
-    @pytest.mark.asyncio
     async def test_connect(self, mock_cosmos_client):
         """Test connecting to Cosmos DB."""
         memory = WarmMemory(
@@ -167,62 +169,31 @@ class TestWarmMemory:
             await memory.connect()
             assert memory.client is not None
 
-    @pytest.mark.asyncio
-    async def test_upsert_item(self, mock_cosmos_client, monkeypatch):
+    async def test_upsert_item(self, mock_cosmos_client):
         """Test upserting an item."""
         memory = WarmMemory(
             account_uri="https://test.documents.azure.com",
             database="test_db",
             container="test_container",
         )
-        monkeypatch.setattr(memory, "client", mock_cosmos_client)
+        memory.client = mock_cosmos_client
 
         item = {"id": "test123", "data": "value"}
         result = await memory.upsert(item)
         assert result["id"] == "test123"
 
-    @pytest.mark.asyncio
-    async def test_upsert_connects_if_needed(self, mock_cosmos_client):
-        """Test upsert auto-connects if not connected."""
-        memory = WarmMemory(
-            account_uri="https://test.documents.azure.com",
-            database="test_db",
-            container="test_container",
-        )
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_cosmos_client
-            await memory.upsert({"id": "test"})
-
-    @pytest.mark.asyncio
-    async def test_read_item(self, mock_cosmos_client, monkeypatch):
+    async def test_read_item(self, mock_cosmos_client):
         """Test reading an item."""
         memory = WarmMemory(
             account_uri="https://test.documents.azure.com",
             database="test_db",
             container="test_container",
         )
-        monkeypatch.setattr(memory, "client", mock_cosmos_client)
+        memory.client = mock_cosmos_client
 
         result = await memory.read("test123", "partition_key")
         assert result["id"] == "test"
 
-    @pytest.mark.asyncio
-    async def test_read_connects_if_needed(self, mock_cosmos_client):
-        """Test read auto-connects if not connected."""
-        memory = WarmMemory(
-            account_uri="https://test.documents.azure.com",
-            database="test_db",
-            container="test_container",
-        )
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_cosmos_client
-            await memory.read("test", "pk")
-
-    @pytest.mark.asyncio
     async def test_connect_is_single_init_under_concurrency(self, mock_cosmos_client):
         """Concurrent first-use connect should initialize once."""
         memory = WarmMemory(
@@ -235,16 +206,16 @@ class TestWarmMemory:
             await asyncio.sleep(0.01)
             return await kwargs["func"]()
 
-        with patch(
-            "holiday_peak_lib.agents.memory.warm.log_async_operation",
-            new=delayed_log_operation,
-        ):
-            with patch("holiday_peak_lib.agents.memory.warm.CosmosClient") as mock_client_class:
-                mock_client_class.return_value = mock_cosmos_client
-                await asyncio.gather(memory.connect(), memory.connect())
+        with patch.multiple(
+            "holiday_peak_lib.agents.memory.warm",
+            log_async_operation=delayed_log_operation,
+            CosmosClient=DEFAULT,
+        ) as mocks:
+            mocks["CosmosClient"].return_value = mock_cosmos_client
+            await asyncio.gather(memory.connect(), memory.connect())
 
         assert memory.client is mock_cosmos_client
-        assert mock_client_class.call_count == 1
+        assert mocks["CosmosClient"].call_count == 1
 
 
 class TestColdMemory:
@@ -273,7 +244,6 @@ class TestColdMemory:
         assert memory.connection_timeout == 5.0
         assert memory.read_timeout == 30.0
 
-    @pytest.mark.asyncio
     async def test_connect(self, mock_blob_client):
         """Test connecting to Blob Storage."""
         memory = ColdMemory(
@@ -286,58 +256,29 @@ class TestColdMemory:
             await memory.connect()
             assert memory.client is not None
 
-    @pytest.mark.asyncio
-    async def test_upload_text(self, mock_blob_client, monkeypatch):
+    async def test_upload_text(self, mock_blob_client):
         """Test uploading text to blob."""
         memory = ColdMemory(
             account_url="https://test.blob.core.windows.net",
             container_name="test_container",
         )
-        monkeypatch.setattr(memory, "client", mock_blob_client)
+        memory.client = mock_blob_client
 
         await memory.upload_text("test_blob.txt", "test data content")
         # Verify container client was obtained
         mock_blob_client.get_container_client.assert_called_once_with("test_container")
 
-    @pytest.mark.asyncio
-    async def test_upload_connects_if_needed(self, mock_blob_client):
-        """Test upload auto-connects if not connected."""
-        memory = ColdMemory(
-            account_url="https://test.blob.core.windows.net",
-            container_name="test_container",
-        )
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_blob_client
-            await memory.upload_text("test.txt", "data")
-
-    @pytest.mark.asyncio
-    async def test_download_text(self, mock_blob_client, monkeypatch):
+    async def test_download_text(self, mock_blob_client):
         """Test downloading text from blob."""
         memory = ColdMemory(
             account_url="https://test.blob.core.windows.net",
             container_name="test_container",
         )
-        monkeypatch.setattr(memory, "client", mock_blob_client)
+        memory.client = mock_blob_client
 
         result = await memory.download_text("test_blob.txt")
         assert result == b"test data"
 
-    @pytest.mark.asyncio
-    async def test_download_connects_if_needed(self, mock_blob_client):
-        """Test download auto-connects if not connected."""
-        memory = ColdMemory(
-            account_url="https://test.blob.core.windows.net",
-            container_name="test_container",
-        )
-
-        with patch.object(memory, "connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = None
-            memory.client = mock_blob_client
-            await memory.download_text("test.txt")
-
-    @pytest.mark.asyncio
     async def test_connect_is_single_init_under_concurrency(self, mock_blob_client):
         """Concurrent first-use connect should initialize once."""
         memory = ColdMemory(
@@ -349,35 +290,67 @@ class TestColdMemory:
             await asyncio.sleep(0.01)
             return await kwargs["func"]()
 
-        with patch(
-            "holiday_peak_lib.agents.memory.cold.log_async_operation",
-            new=delayed_log_operation,
-        ):
-            with patch(
-                "holiday_peak_lib.agents.memory.cold.BlobServiceClient"
-            ) as mock_client_class:
-                mock_client_class.return_value = mock_blob_client
-                await asyncio.gather(memory.connect(), memory.connect())
+        with patch.multiple(
+            "holiday_peak_lib.agents.memory.cold",
+            log_async_operation=delayed_log_operation,
+            BlobServiceClient=DEFAULT,
+        ) as mocks:
+            mocks["BlobServiceClient"].return_value = mock_blob_client
+            await asyncio.gather(memory.connect(), memory.connect())
 
         assert memory.client is mock_blob_client
-        assert mock_client_class.call_count == 1
+        assert mocks["BlobServiceClient"].call_count == 1
+
+
+class TestConnectsIfNeeded:
+    """Test that every tier operation auto-connects if not connected."""
+
+    @pytest.mark.parametrize(
+        ("memory_factory", "client_fixture", "method", "args"),
+        [
+            (_hot_memory, "mock_redis_client", "set", ("key", "value")),
+            (_hot_memory, "mock_redis_client", "get", ("key",)),
+            (_warm_memory, "mock_cosmos_client", "upsert", ({"id": "test"},)),
+            (_warm_memory, "mock_cosmos_client", "read", ("test", "pk")),
+            (_cold_memory, "mock_blob_client", "upload_text", ("test.txt", "data")),
+            (_cold_memory, "mock_blob_client", "download_text", ("test.txt",)),
+        ],
+        ids=["hot-set", "hot-get", "warm-upsert", "warm-read", "cold-upload", "cold-download"],
+    )
+    async def test_operation_connects_if_needed(
+        self, request, memory_factory, client_fixture, method, args
+    ):
+        """Test the operation connects first and then runs against the client."""
+        memory = memory_factory()
+        client = request.getfixturevalue(client_fixture)
+
+        def _connect():
+            memory.client = client
+            return _resolved(None)
+
+        with patch.object(memory, "connect", new=MagicMock(side_effect=_connect)) as connect:
+            await getattr(memory, method)(*args)
+
+        # connect() is a plain MagicMock returning a completed future, so it has no
+        # await bookkeeping; a single call is the await the operation made.
+        connect.assert_called_once_with()
+        assert memory.client is client
 
 
 class TestMemoryIntegration:
     """Test memory tier integration."""
 
-    @pytest.mark.asyncio
     async def test_three_tier_memory_setup(
-        self, mock_redis_client, mock_cosmos_client, mock_blob_client, monkeypatch
+        self, mock_redis_client, mock_cosmos_client, mock_blob_client
     ):
         """Test setting up all three memory tiers."""
         hot = HotMemory("redis://localhost:6379")
         warm = WarmMemory("https://test.documents.azure.com", "db", "container")
         cold = ColdMemory("https://test.blob.core.windows.net", "container")
 
-        monkeypatch.setattr(hot, "client", mock_redis_client)
-        monkeypatch.setattr(warm, "client", mock_cosmos_client)
-        monkeypatch.setattr(cold, "client", mock_blob_client)
+        hot.client = mock_redis_client
+        warm.client = mock_cosmos_client
+        cold.client = mock_blob_client
 
         # Test operations on each tier
         await hot.set("key", "value")
@@ -1,79 +1,79 @@
 """Tests for retry utilities."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
+from holiday_peak_lib.utils import retry as retry_module
 from holiday_peak_lib.utils.retry import async_retry
 
+RETRY_3 = async_retry(times=3, delay_seconds=0.01)
+RETRY_2 = async_retry(times=2, delay_seconds=0.01)
+
+
+@pytest.fixture(autouse=True)
+def retry_sleep(monkeypatch):
+    """Replace the backoff sleep so retries assert counts, not wall-clock time."""
+    sleep = AsyncMock()
+    # Swap only the retry module's asyncio reference; other tasks on the shared
+    # session loop keep the real asyncio.sleep.
+    monkeypatch.setattr(retry_module, "asyncio", SimpleNamespace(sleep=sleep))
+    return sleep
+
 
-@pytest.mark.asyncio
 class TestAsyncRetry:
     """Tests for async_retry decorator."""
 
     async def test_successful_first_attempt(self):
         """Test successful execution on first try."""
-        call_count = 0
+        func = AsyncMock(return_value="success")
 
-        @async_retry(times=3, delay_seconds=0.01)
-        async def successful_func():
-            nonlocal call_count
-            call_count += 1
-            return "success"
-
-        result = await successful_func()
+        result = await RETRY_3(func)()
         assert result == "success"
-        assert call_count == 1
+        assert func.await_count == 1
 
     async def test_retry_after_failures(self):
         """Test retrying after failures then succeeding."""
-        call_count = 0
-
-        @async_retry(times=3, delay_seconds=0.01)
-        async def eventually_successful():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise ValueError("Not yet")
-            return "finally worked"
+        func = AsyncMock(
+            side_effect=[ValueError("Not yet"), ValueError("Not yet"), "finally worked"]
+        )
 
-        result = await eventually_successful()
+        result = await RETRY_3(func)()
         assert result == "finally worked"
-        assert call_count == 3
+        assert func.await_count == 3
 
     async def test_exhausts_retries_and_raises(self):
         """Test that error is raised after all retries exhausted."""
-        call_count = 0
-
-        @async_retry(times=2, delay_seconds=0.01)
-        async def always_fails():
-            nonlocal call_count
-            call_count += 1
-            raise RuntimeError("Always fails")
+        func = AsyncMock(side_effect=RuntimeError("Always fails"))
 
         with pytest.raises(RuntimeError, match="Always fails"):
-            await always_fails()
-        assert call_count == 2
+            await RETRY_2(func)()
+        assert func.await_count == 2
 
     async def test_different_error_types(self):
         """Test retry with different error types."""
-
-        @async_retry(times=3, delay_seconds=0.01)
-        async def mixed_errors():
-            raise ConnectionError("Network issue")
+        func = AsyncMock(side_effect=ConnectionError("Network issue"))
 
         with pytest.raises(ConnectionError, match="Network issue"):
-            await mixed_errors()
+            await RETRY_3(func)()
 
     async def test_with_arguments(self):
         """Test decorated function with arguments."""
-        call_count = 0
+        func = AsyncMock(side_effect=[ValueError("Retry"), "x-y-z"])
 
-        @async_retry(times=3, delay_seconds=0.01)
-        async def func_with_args(a, b, c=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 2:
-                raise ValueError("Retry")
-            return f"{a}-{b}-{c}"
-
-        result = await func_with_args("x", "y", c="z")
+        result = await RETRY_3(func)("x", "y", c="z")
         assert result == "x-y-z"
-        assert call_count == 2
+        assert func.await_count == 2
+        func.assert_awaited_with("x", "y", c="z")
+
+    async def test_delay_respected(self, retry_sleep):
+        """Test that each failed attempt waits for the configured delay."""
+
+        @async_retry(times=3, delay_seconds=0.25)
+        async def always_fails():
+            raise ValueError("Retry")
+
+        with pytest.raises(ValueError):
+            await always_fails()
+        assert retry_sleep.await_args_list
+        assert {awaited.args for awaited in retry_sleep.await_args_list} == {(0.25,)}
@@ -1,9 +1,10 @@
 """Unit tests for TruthStoreAdapter with mocked Cosmos DB client."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from azure.cosmos.aio import ContainerProxy, CosmosClient, DatabaseProxy
 from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
 from holiday_peak_lib.adapters.base import AdapterError
 from holiday_peak_lib.adapters.truth_store import TruthStoreAdapter
@@ -38,9 +39,9 @@ def _make_adapter(mock_client=None) -> TruthStoreAdapter:
 
 def _mock_cosmos_client(return_item=None, items=None):
     """Build a mock CosmosClient that returns fixed data."""
-    client = MagicMock()
-    db = MagicMock()
-    container = MagicMock()
+    client = MagicMock(spec_set=CosmosClient)
+    db = MagicMock(spec_set=DatabaseProxy)
+    container = MagicMock(spec_set=ContainerProxy)
 
     # Sync item reads/writes
     container.read_item = AsyncMock(return_value=return_item)
@@ -59,29 +60,28 @@ def _mock_cosmos_client(return_item=None, items=None):
     return client, container
 
 
+@pytest.fixture
+def cosmos_client_cls(monkeypatch):
+    """Patch the credential and CosmosClient constructors used by connect()."""
+    monkeypatch.setattr("holiday_peak_lib.adapters.truth_store.DefaultAzureCredential", MagicMock())
+    client_cls = MagicMock(return_value=MagicMock(spec_set=CosmosClient))
+    monkeypatch.setattr("holiday_peak_lib.adapters.truth_store.CosmosClient", client_cls)
+    return client_cls
+
+
 class TestTruthStoreAdapterConnect:
     @pytest.mark.asyncio
-    async def test_connect_creates_client(self):
+    async def test_connect_creates_client(self, cosmos_client_cls):
         adapter = _make_adapter()
-        with (
-            patch("holiday_peak_lib.adapters.truth_store.DefaultAzureCredential") as mock_cred,
-            patch("holiday_peak_lib.adapters.truth_store.CosmosClient") as mock_cls,
-        ):
-            mock_cls.return_value = MagicMock()
-            await adapter.connect()
-            mock_cls.assert_called_once()
-            assert adapter.client is not None
+        await adapter.connect()
+        cosmos_client_cls.assert_called_once()
+        assert adapter.client is not None
 
     @pytest.mark.asyncio
-    async def test_ensure_connected_auto_connects(self):
+    async def test_ensure_connected_auto_connects(self, cosmos_client_cls):
         adapter = _make_adapter()
-        with (
-            patch("holiday_peak_lib.adapters.truth_store.DefaultAzureCredential"),
-            patch("holiday_peak_lib.adapters.truth_store.CosmosClient") as mock_cls,
-        ):
-            mock_cls.return_value = MagicMock()
-            await adapter._ensure_connected()
-            assert adapter.client is not None
+        await adapter._ensure_connected()
+        assert adapter.client is not None
 
 
 class TestGetContainer:
@@ -1,7 +1,7 @@
 """Tests for logging utilities."""
 
 import logging
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from holiday_peak_lib.utils.logging import (
@@ -10,6 +10,36 @@ from holiday_peak_lib.utils.logging import (
     log_operation,
 )
 
+_LARGE_METADATA = {"large": "x" * 1000}
+
+
+@pytest.fixture
+def configure_azure_monitor(monkeypatch):
+    """Keep configure_logging from starting the real Azure Monitor exporter."""
+    configure = Mock()
+    monkeypatch.setattr("azure.monitor.opentelemetry.configure_azure_monitor", configure)
+    # The Azure Monitor branch setdefaults OTEL_SERVICE_NAME; register the variable
+    # with monkeypatch before clearing it so teardown restores the prior state.
+    monkeypatch.setenv("OTEL_SERVICE_NAME", "")
+    monkeypatch.delenv("OTEL_SERVICE_NAME")
+    return configure
+
+
+@pytest.fixture(autouse=True)
+def _no_app_insights_env(monkeypatch):
+    """Ignore a developer's App Insights connection string so no real exporter starts."""
+    monkeypatch.delenv("APPLICATIONINSIGHTS_CONNECTION_STRING", raising=False)
+    monkeypatch.delenv("APPINSIGHTS_CONNECTION_STRING", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_handlers():
+    """Drop handlers on loggers a test created so they never accumulate across tests."""
+    existing = set(logging.Logger.manager.loggerDict)
+    yield
+    for name in set(logging.Logger.manager.loggerDict) - existing:
+        logging.getLogger(name).handlers.clear()
+
 
 class TestConfigureLogging:
     """Test configure_logging function."""
@@ -32,20 +62,23 @@ class TestConfigureLogging:
         assert logger is not None
         # Should still work without connection string
 
-    def test_configure_logging_with_connection_string(self, monkeypatch):
+    def test_configure_logging_with_connection_string(self, configure_azure_monitor):
         """Test logging with Azure Monitor connection string."""
         conn_string = "InstrumentationKey=test-key"
 
-        # Just test that it doesn't raise an error
-        logger = configure_logging(connection_string=conn_string)
+        logger = configure_logging(connection_string=conn_string, app_name="test-monitor-arg")
         assert logger is not None
+        configure_azure_monitor.assert_called_once_with(connection_string=conn_string)
 
-    def test_configure_logging_from_env(self, monkeypatch):
+    def test_configure_logging_from_env(self, configure_azure_monitor, monkeypatch):
         """Test reading connection string from environment."""
         monkeypatch.setenv("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=env-key")
 
-        logger = configure_logging()
+        logger = configure_logging(app_name="test-monitor-env")
         assert logger is not None
+        configure_azure_monitor.assert_called_once_with(
+            connection_string="InstrumentationKey=env-key"
+        )
 
     def test_configure_logging_idempotent(self):
         """Test that calling configure_logging multiple times is safe."""
@@ -53,6 +86,7 @@ class TestConfigureLogging:
         logger2 = configure_logging(app_name="test-app-1")
         assert logger1 is not None
         assert logger2 is not None
+        assert len(logger2.logger.handlers) == 1
 
     def test_logger_has_handlers(self):
         """Test that logger has appropriate handlers."""
@@ -64,16 +98,14 @@ class TestConfigureLogging:
 class TestLogAsyncOperation:
     """Test log_async_operation function."""
 
-    @pytest.mark.asyncio
-    async def test_log_successful_operation(self):
+    async def test_log_successful_operation(self, base_logger):
         """Test logging a successful async operation."""
-        logger = configure_logging(app_name="test-async")
 
         async def test_func():
             return {"result": "success"}
 
         result = await log_async_operation(
-            logger,
+            base_logger,
             name="test_op",
             intent="test_intent",
             func=test_func,
@@ -83,71 +115,61 @@ class TestLogAsyncOperation:
 
         assert result["result"] == "success"
 
-    @pytest.mark.asyncio
-    async def test_log_failed_operation(self):
+    async def test_log_failed_operation(self, base_logger):
         """Test logging a failed async operation."""
-        logger = configure_logging(app_name="test-async-fail")
 
         async def failing_func():
             raise ValueError("Test error")
 
         with pytest.raises(ValueError, match="Test error"):
             await log_async_operation(
-                logger, name="test_op", intent="test_intent", func=failing_func
+                base_logger, name="test_op", intent="test_intent", func=failing_func
             )
 
-    @pytest.mark.asyncio
-    async def test_log_operation_with_none_result(self):
+    async def test_log_operation_with_none_result(self, base_logger):
         """Test logging operation that returns None."""
-        logger = configure_logging(app_name="test-none")
 
         async def none_func():
             return None
 
         result = await log_async_operation(
-            logger, name="test_op", intent="test_intent", func=none_func
+            base_logger, name="test_op", intent="test_intent", func=none_func
         )
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_log_operation_estimates_tokens(self):
+    async def test_log_operation_estimates_tokens(self, base_logger):
         """Test token estimation in logging."""
-        logger = configure_logging(app_name="test-tokens")
 
         async def test_func():
             return "result"
 
         result = await log_async_operation(
-            logger,
+            base_logger,
             name="test_op",
             intent="test_intent",
             func=test_func,
-            metadata={"large": "x" * 1000},  # Large metadata for token estimation
+            metadata=_LARGE_METADATA,  # Large metadata for token estimation
         )
 
         assert result == "result"
 
-    @pytest.mark.asyncio
-    async def test_log_operation_tracks_memory(self):
+    async def test_log_operation_tracks_memory(self, base_logger):
         """Test memory tracking in async operation."""
-        logger = configure_logging(app_name="test-memory")
 
         async def test_func():
             # Allocate some memory
-            data = [i for i in range(1000)]
+            data = list(range(1000))
             return {"count": len(data)}
 
         result = await log_async_operation(
-            logger, name="test_op", intent="test_intent", func=test_func
+            base_logger, name="test_op", intent="test_intent", func=test_func
         )
 
         assert result["count"] == 1000
 
-    @pytest.mark.asyncio
-    async def test_log_operation_with_custom_metadata(self):
+    async def test_log_operation_with_custom_metadata(self, base_logger):
         """Test logging with custom metadata."""
-        logger = configure_logging(app_name="test-metadata")
 
         async def test_func():
             return "ok"
@@ -159,7 +181,7 @@ class TestLogAsyncOperation:
         }
 
         result = await log_async_operation(
-            logger,
+            base_logger,
             name="test_op",
             intent="test_intent",
             func=test_func,
@@ -172,12 +194,10 @@ class TestLogAsyncOperation:
 class TestLogOperation:
     """Test log_operation context manager."""
 
-    def test_log_successful_sync_operation(self):
+    def test_log_successful_sync_operation(self, base_logger):
         """Test logging a successful sync operation."""
-        logger = configure_logging(app_name="test-sync")
-
         with log_operation(
-            logger,
+            base_logger,
             name="test_op",
             intent="test_intent",
             token_count=50,
@@ -187,40 +207,32 @@ class TestLogOperation:
 
         assert result == "success"
 
-    def test_log_failed_sync_operation(self):
+    def test_log_failed_sync_operation(self, base_logger):
         """Test logging a failed sync operation."""
-        logger = configure_logging(app_name="test-sync-fail")
-
         with pytest.raises(ValueError, match="Test error"):
-            with log_operation(logger, name="test_op", intent="test_intent"):
+            with log_operation(base_logger, name="test_op", intent="test_intent"):
                 raise ValueError("Test error")
 
-    def test_log_operation_context_manager_cleanup(self):
+    def test_log_operation_context_manager_cleanup(self, base_logger):
         """Test context manager cleanup on success."""
-        logger = configure_logging(app_name="test-cleanup")
-
         counter = {"value": 0}
 
-        with log_operation(logger, name="test_op", intent="test"):
+        with log_operation(base_logger, name="test_op", intent="test"):
             counter["value"] = 1
 
         assert counter["value"] == 1
 
-    def test_log_operation_multiple_calls(self):
+    def test_log_operation_multiple_calls(self, base_logger):
         """Test multiple calls to log_operation."""
-        logger = configure_logging(app_name="test-multiple")
-
         for i in range(3):
-            with log_operation(logger, name=f"op_{i}", intent="test"):
+            with log_operation(base_logger, name=f"op_{i}", intent="test"):
                 pass
 
-    def test_log_operation_with_metadata(self):
+    def test_log_operation_with_metadata(self, base_logger):
         """Test log_operation with metadata."""
-        logger = configure_logging(app_name="test-meta")
-
         metadata = {"iteration": 1, "batch_size": 100}
 
-        with log_operation(logger, name="test_op", intent="processing", metadata=metadata):
+        with log_operation(base_logger, name="test_op", intent="processing", metadata=metadata):
             result = "processed"
 
         assert result == "processed"
@@ -229,49 +241,51 @@ class TestLogOperation:
 class TestLoggingIntegration:
     """Test logging integration scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_nested_async_logging(self):
+    async def test_nested_async_logging(self, base_logger):
         """Test nested async operations with logging."""
-        logger = configure_logging(app_name="test-nested")
 
         async def inner_func():
             return "inner_result"
 
         async def outer_func():
             inner_result = await log_async_operation(
-                logger, name="inner_op", intent="inner", func=inner_func
+                base_logger, name="inner_op", intent="inner", func=inner_func
             )
             return {"outer": "result", "inner": inner_result}
 
-        result = await log_async_operation(logger, name="outer_op", intent="outer", func=outer_func)
+        result = await log_async_operation(
+            base_logger, name="outer_op", intent="outer", func=outer_func
+        )
 
         assert result["inner"] == "inner_result"
         assert result["outer"] == "result"
 
-    def test_sync_and_async_logging_together(self):
+    def test_sync_and_async_logging_together(self, base_logger):
         """Test using sync and async logging together."""
-        logger = configure_logging(app_name="test-mixed")
-
-        with log_operation(logger, name="sync_op", intent="sync"):
+        with log_operation(base_logger, name="sync_op", intent="sync"):
             sync_result = "sync_done"
 
         assert sync_result == "sync_done"
 
-    @pytest.mark.asyncio
-    async def test_logging_performance_tracking(self):
+    async def test_logging_performance_tracking(self, base_logger, monkeypatch):
         """Test that logging tracks performance metrics."""
-        import asyncio
-
-        logger = configure_logging(app_name="test-perf")
+        monkeypatch.setattr(
+            "holiday_peak_lib.utils.logging.perf_counter", iter([0.0, 0.1]).__next__
+        )
+        info = Mock()
+        monkeypatch.setattr(base_logger, "info", info)
 
         async def slow_func():
-            await asyncio.sleep(0.1)
             return "done"
 
-        result = await log_async_operation(logger, name="slow_op", intent="test", func=slow_func)
+        result = await log_async_operation(
+            base_logger, name="slow_op", intent="test", func=slow_func
+        )
 
         assert result == "done"
-        # Duration should be logged (>= 100ms)
+        # Duration is logged from the stubbed clock as 100ms
+        message, *args = info.call_args.args
+        assert "duration_ms=100.00" in message % tuple(args)
 
     def test_logging_with_different_app_names(self):
         """Test logging with different app names."""